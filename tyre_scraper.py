@@ -11,27 +11,55 @@ Key facts about the site (CS-Cart):
   - Each product card is separated by <hr> tags on listing pages
 
 Usage:
-    pip install requests beautifulsoup4 lxml
+    pip install requests "httpx[http2]" lxml orjson
+    pip install requests-cache                           # optional, for --cache
     python tyre_scraper.py                               # ALL tyres (all pages)
     python tyre_scraper.py --search "michelin road 6"   # keyword search
     python tyre_scraper.py --category lichidari-de-stoc # other section
+    python tyre_scraper.py --cache                      # reuse pages cached < 1h ago
     python tyre_scraper.py --help
 
 Output:
-    tyre_results.json  ← load into tyre_dashboard.html
-    tyre_results.csv   ← open in Excel
+    tyre_results.jsonl   ← one product per line, written while scraping
+    tyre_results.json.gz ← load into tyre_dashboard.html (compact, gzipped)
+    tyre_results.json    ← same data, indented (only with --pretty)
+    tyre_results.csv     ← open in Excel
 """
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import gzip
+import heapq
 import json
+import multiprocessing
+import operator
+import os
 import re
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import BinaryIO, Iterable
 from urllib.parse import quote_plus, urljoin
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson   # optional: much faster JSON output
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache   # optional: on-disk HTTP cache for --cache
+except ImportError:
+    requests_cache = None
 
 BASE_URL = "https://www.anvelopemoto.eu"
 SOURCE   = "anvelopemoto.eu"
@@ -47,17 +75,130 @@ HEADERS = {
     "Referer": "https://www.anvelopemoto.eu/",
 }
 
-SESSION = requests.Session()
-SESSION.headers.update(HEADERS)
+# Transient errors are retried this many times, waiting
+# RETRY_BACKOFF * 2**n seconds (or the server's Retry-After, up to a cap)
+RETRY_TOTAL     = 3
+RETRY_BACKOFF   = 0.5
+RETRY_STATUSES  = (429, 502, 503, 504)
+RETRY_AFTER_MAX = 60
+
+# Pages cached by --cache are reused for this long (seconds)
+CACHE_NAME   = "tyres_cache"
+CACHE_EXPIRE = 3600
+
+# Max number of listing pages fetched at the same time (be polite to the shop)
+CONCURRENCY = 8
 
 # Matches Romanian prices like "67,01" or "1.335,62" followed by "lei"
-PRICE_RE = re.compile(r"([\d]{1,4}(?:\.\d{3})*,\d{2})\s*lei")
+PRICE_RE    = re.compile(r"([\d]{1,4}(?:\.\d{3})*,\d{2})\s*lei")
+DISCOUNT_RE = re.compile(r"Reducere\s+(\d+%)")
+COD_RE      = re.compile(r"Cod produs:\s*(\S+)")
+
+# Availability phrases → (in_stock, label), in priority order: if a card
+# mentions several, the first one listed here wins
+AVAILABILITY = {
+    "momentan indisponibil": (False, "Out of stock"),
+    "stoc bucuresti":        (True,  "In stock (Bucharest)"),
+    "in stoc furnizor":      (True,  "In stock (supplier)"),
+    "la comanda":            (True,  "Order only"),
+}
+AVAIL_RE = re.compile("|".join(map(re.escape, AVAILABILITY)), re.IGNORECASE)
+
+# Pagination: "/page-7/" hrefs, and "2 - 16" style grouped link texts
+PAGE_N_RE = re.compile(r"/page-(\d+)/?$")
+RANGE_RE  = re.compile(r"(\d+)\s*-\s*(\d+)")
+
+# Text inside these tags is never shown on the page
+SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+
+# A product card is the innermost element around its link that mentions
+# "lei" and has less text than this; page sections never count as a card
+CARD_MAX_TEXT  = 3000
+CARD_STOP_TAGS = {"body", "html", "main", "nav", "header", "footer"}
+
+# Links containing any of these are site pages / brand & category listings,
+# not products. Joined into one regex so each href is scanned once.
+URL_BLACKLIST = (
+    "dispatch=", "/blog", "profiles", "compare", "wishlist",
+    "locatia", "intrebari", "garantie", "pages.view", "fan-zone",
+    "/accesorii", "/camere-de-aer", "/consumabile", "/rim-band",
+    "/mousse", "/tubliss", "/rim-lock", "/uleiuri", "/transmisie",
+    "/diverse", "/montaj", "/contragreutati", "/valve", "/petice",
+    "/alligator", "/avon", "/bridgestone/", "/cheng-shin", "/continental",
+    "/cst", "/dunlop/", "/duro", "/eurogrip", "/heidenau/",
+    "/irc", "/kenda", "/maxxis", "/mefo", "/metzeler/", "/michelin/",
+    "/mitas/", "/motorex", "/motul", "/pirelli/", "/plews/",
+    "/schwalbe", "/shinko/", "/vee-rubber", "/vipal",
+    "/anvelope-moto/", "/lichidari-de-stoc/", "/ek/", "/duro/",
+    "/goldspeed/", "/heidenau-racing/", "/hiflo/", "/hofmann/",
+    "/hutchinson/", "/jmp/", "/kn/", "/lampa/",
+)
+URL_BLACKLIST_RE = re.compile("|".join(map(re.escape, URL_BLACKLIST)))
+
+
+@dataclass(slots=True, frozen=True)
+class Product:
+    """One scraped tyre. Field order is the column order of the output files."""
+    source:         str
+    name:           str
+    price:          str
+    original_price: str
+    price_value:    float | None
+    currency:       str
+    discount:       str
+    availability:   str
+    in_stock:       bool
+    product_code:   str
+    shop:           str
+    url:            str
+    scraped_at:     str
+
+
+FIELDS = tuple(f.name for f in fields(Product))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+def make_session(session: requests.Session | None = None) -> requests.Session:
+    """Set up headers, connection pooling and retries on a (new) session."""
+    session = session or requests.Session()
+    session.headers.update(HEADERS)
+    session.headers["Connection"] = "keep-alive"
+
+    # Bigger keep-alive pool, and retry transient errors with backoff
+    # instead of dropping the page
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = make_session()
+
+
+def enable_cache() -> None:
+    """Swap SESSION for one backed by an SQLite HTTP cache (requests-cache)."""
+    global SESSION
+    if requests_cache is None:
+        raise SystemExit("--cache needs requests-cache: pip install requests-cache")
+    SESSION = make_session(requests_cache.CachedSession(
+        CACHE_NAME,
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE,
+        allowable_methods=("GET",),
+    ))
+
+
 def parse_ron(s: str) -> float | None:
     """'1.335,62' → 1335.62"""
     try:
@@ -70,21 +211,226 @@ def fmt(s: str) -> str:
     return f"{s} lei" if s else ""
 
 
-def fetch(url: str) -> BeautifulSoup | None:
+def jsonl_line(p: Product) -> bytes:
+    """One product as a line of JSON Lines."""
+    if orjson is not None:
+        return orjson.dumps(p) + b"\n"
+    return json.dumps(asdict(p), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def read_jsonl(path: str) -> Iterable[Product]:
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                data = orjson.loads(line) if orjson is not None else json.loads(line)
+                yield Product(**data)
+
+
+def fetch(url: str) -> bytes | None:
+    """GET a page and return the raw HTML bytes, or None on error."""
     try:
         r = SESSION.get(url, timeout=20)
         r.raise_for_status()
-        return BeautifulSoup(r.text, "lxml")
+        # Keep the raw bytes: r.text would run charset detection first
+        return r.content
     except requests.RequestException as e:
         print(f"    ✗ {e}")
         return None
 
 
+def retry_delay(r: httpx.Response | None, attempt: int) -> float:
+    """Seconds to wait before retry number attempt (0-based)."""
+    retry_after = r.headers.get("Retry-After", "").strip() if r is not None else ""
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+                if when.tzinfo is None:   # "-0000" dates parse as naive UTC
+                    when = when.replace(tzinfo=timezone.utc)
+                delay = (when - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), RETRY_AFTER_MAX)
+    return RETRY_BACKOFF * 2 ** attempt
+
+
+async def get_with_retry(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """
+    client.get() with the same retry policy as SESSION: transient statuses
+    and connection errors are retried with backoff, honouring Retry-After.
+    """
+    attempt = 0
+    while True:
+        try:
+            r = await client.get(url)
+        except httpx.TransportError:
+            if attempt == RETRY_TOTAL:
+                raise
+            r = None
+        else:
+            if r.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return r
+        await asyncio.sleep(retry_delay(r, attempt))
+        attempt += 1
+
+
+async def fetch_async(
+    client: httpx.AsyncClient | None,
+    sem: asyncio.Semaphore,
+    url: str,
+) -> bytes | None:
+    """
+    Async counterpart of fetch(): returns the raw HTML bytes, or None on error.
+    With no client, the page is fetched through SESSION in a thread, so that
+    the --cache HTTP cache is used.
+    """
+    async with sem:
+        if client is None:
+            html = await asyncio.to_thread(fetch, url)
+            if html is None:
+                return None
+        else:
+            try:
+                r = await get_with_retry(client, url)
+                r.raise_for_status()
+                html = r.content
+            except httpx.HTTPError as e:
+                print(f"    ✗ {url}: {e}")
+                return None
+        # Small pause while still holding the slot, so bursts stay polite
+        await asyncio.sleep(0.2)
+        return html
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Product card parser — works on listing pages
 # ─────────────────────────────────────────────────────────────────────────────
 
-def parse_listing_page(soup: BeautifulSoup) -> list[dict]:
+def is_product_link(href: str, title: str) -> bool:
+    # Product URLs: https://www.anvelopemoto.eu/<slug>/
+    # They have a meaningful title and no utility keywords
+    return (
+        href.startswith("https://www.anvelopemoto.eu/")
+        and len(title) > 8
+        and not URL_BLACKLIST_RE.search(href)
+    )
+
+
+class ListingTarget:
+    """
+    lxml parser target that scans a listing page without building a tree.
+
+    Only the page's text nodes are kept, plus a stack of the open elements
+    (tag and where their text starts). A product link waits until one of its
+    ancestors closes whose text mentions "lei" and is under CARD_MAX_TEXT
+    characters; that element's text becomes the card: (href, title, text).
+    Reaching a CARD_STOP_TAGS element first gives the card no text.
+    All <a href> links are kept as (href, text) for the pagination helpers.
+    """
+
+    def __init__(self) -> None:
+        self.cards: list[tuple[str, str, str]] = []
+        self.links: list[tuple[str, str]] = []
+        self._texts: list[str] = []                 # stripped text nodes, in order
+        self._ends: list[int] = [0]                 # len(" ".join(texts[:i])) + i
+        self._last_lei = -1                         # index of last text with "lei"
+        self._chunks: list[str] = []                # pending pieces of one text node
+        self._order = 0                             # elements started so far
+        self._stack: list[tuple[str, int, int]] = []        # (tag, order, text start)
+        self._anchors: list[tuple[int, str, int]] = []      # open <a>: (order, href, text start)
+        self._pending: list[tuple[int, str, str]] = []      # product links without a card
+        self._skip = 0
+
+    def _flush_text(self) -> None:
+        if not self._chunks:
+            return
+        text = "".join(self._chunks).strip()
+        self._chunks.clear()
+        if text:
+            if "lei" in text:
+                self._last_lei = len(self._texts)
+            self._texts.append(text)
+            self._ends.append(self._ends[-1] + len(text) + 1)
+
+    def _text(self, start: int) -> str:
+        return " ".join(self._texts[start:])
+
+    def _close_card(self, tag: str, order: int, start: int) -> None:
+        # Product links that opened after this element did are inside it
+        split = len(self._pending)
+        while split and self._pending[split - 1][0] > order:
+            split -= 1
+        if split == len(self._pending):
+            return
+
+        if tag in CARD_STOP_TAGS:
+            text = ""
+        elif (
+            self._last_lei >= start
+            and self._ends[-1] - self._ends[start] - 1 < CARD_MAX_TEXT
+        ):
+            text = self._text(start)
+        else:
+            return   # not a card; keep looking further up
+
+        for _, href, title in self._pending[split:]:
+            self.cards.append((href, title, text))
+        del self._pending[split:]
+
+    def start(self, tag: str, attrib: dict) -> None:
+        self._flush_text()
+        self._order += 1
+        self._stack.append((tag, self._order, len(self._texts)))
+        if tag in SKIP_TEXT_TAGS:
+            self._skip += 1
+        elif tag == "a" and (href := attrib.get("href")):
+            self._anchors.append((self._order, href, len(self._texts)))
+            title = attrib.get("title", "").strip()
+            if is_product_link(href, title):
+                self._pending.append((self._order, href, title))
+
+    def end(self, tag: str) -> None:
+        self._flush_text()
+        if not self._stack:
+            return
+        tag, order, start = self._stack.pop()
+        if tag in SKIP_TEXT_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        if self._anchors and self._anchors[-1][0] == order:
+            _, href, text_start = self._anchors.pop()
+            self.links.append((href, self._text(text_start)))
+        if self._pending:
+            self._close_card(tag, order, start)
+
+    def data(self, text: str) -> None:
+        if not self._skip:
+            self._chunks.append(text)
+
+    def close(self) -> "ListingTarget":
+        self._flush_text()
+        while self._stack:
+            self.end(self._stack[-1][0])
+        # Links never inside a card-like element get no text
+        self.cards.extend((href, title, "") for _, href, title in self._pending)
+        self._pending.clear()
+        return self
+
+
+def scan_page(content: bytes) -> ListingTarget:
+    """Stream raw HTML through a ListingTarget; returns the filled target."""
+    # The shop serves UTF-8; telling lxml up front skips encoding sniffing
+    parser = etree.HTMLParser(target=ListingTarget(), encoding="utf-8")
+    return etree.fromstring(content, parser)
+
+
+def parse_listing_page(
+    page: ListingTarget,
+    seen_urls: set[str] | None = None,
+    scraped_at: str | None = None,
+) -> list[Product]:
     """
     On listing pages, each product is a block of HTML separated by <hr> tags.
     Each block contains:
@@ -94,66 +440,30 @@ def parse_listing_page(soup: BeautifulSoup) -> list[dict]:
         e.g. "67,01 lei" then "247,32 lei"
       - Availability text ("Stoc Bucuresti", "la comanda", "Momentan Indisponibil")
       - Optional discount label in the <a> tag text or nearby span
+
+    seen_urls holds product URLs already parsed; pass one set for a whole
+    scrape so products repeated across pages are skipped before parsing.
+    scraped_at is stamped on every product; pass one value per scrape run
+    so all pages share the same timestamp.
     """
+    scraped_at = scraped_at or datetime.now().isoformat()
     results = []
 
-    # Each product card sits between <hr> separators in the main content area.
-    # We find all product links (they have a title= and point to a product slug).
-    product_links = []
-    for a in soup.select("a[title][href]"):
-        href  = a.get("href", "")
-        title = a.get("title", "").strip()
-        # Product URLs: https://www.anvelopemoto.eu/<slug>/
-        # They have a meaningful title and no utility keywords
-        if (
-            href.startswith("https://www.anvelopemoto.eu/")
-            and title
-            and len(title) > 8
-            and not any(x in href for x in [
-                "dispatch=", "/blog", "profiles", "compare", "wishlist",
-                "locatia", "intrebari", "garantie", "pages.view", "fan-zone",
-                "/accesorii", "/camere-de-aer", "/consumabile", "/rim-band",
-                "/mousse", "/tubliss", "/rim-lock", "/uleiuri", "/transmisie",
-                "/diverse", "/montaj", "/contragreutati", "/valve", "/petice",
-                "/alligator", "/avon", "/bridgestone/", "/cheng-shin", "/continental",
-                "/cst", "/dunlop/", "/duro", "/eurogrip", "/heidenau/",
-                "/irc", "/kenda", "/maxxis", "/mefo", "/metzeler/", "/michelin/",
-                "/mitas/", "/motorex", "/motul", "/pirelli/", "/plews/",
-                "/schwalbe", "/shinko/", "/vee-rubber", "/vipal",
-                "/anvelope-moto/", "/lichidari-de-stoc/", "/ek/", "/duro/",
-                "/goldspeed/", "/heidenau-racing/", "/hiflo/", "/hofmann/",
-                "/hutchinson/", "/jmp/", "/kn/", "/lampa/",
-            ])
-        ):
-            product_links.append((href, title, a))
+    # Deduplicate by URL (same product can appear in multiple sections/pages)
+    if seen_urls is None:
+        seen_urls = set()
 
-    # Deduplicate by URL (same product can appear in multiple sections)
-    seen_urls: set[str] = set()
-
-    for href, title, anchor in product_links:
+    for href, title, raw_text in page.cards:
         if href in seen_urls:
             continue
         seen_urls.add(href)
 
-        # Find the nearest container that holds price info.
-        # Walk up from the anchor until we find a block with "lei" in text.
-        container = None
-        for parent in anchor.parents:
-            if parent.name in ("body", "html", "main", "nav", "header", "footer"):
-                break
-            text = parent.get_text(" ", strip=True)
-            if "lei" in text and len(text) < 3000:
-                container = parent
-                break
-
-        raw_text = container.get_text(" ", strip=True) if container else ""
-
         # ── Prices ──────────────────────────────────────────────────────────
         # PRICE_RE finds all "X,XX lei" or "X.XXX,XX lei" patterns
         price_matches = PRICE_RE.findall(raw_text)
 
         # Filter out nonsense (e.g. "1 buc." quantities that look price-like)
-        numeric = [(p, parse_ron(p)) for p in price_matches if parse_ron(p)]
+        numeric = [(p, v) for p in price_matches if (v := parse_ron(p))]
 
         sale_price_str = ""
         orig_price_str = ""
@@ -167,55 +477,53 @@ def parse_listing_page(soup: BeautifulSoup) -> list[dict]:
                 orig_price_str = numeric_sorted[-1][0]
 
         # ── Availability ─────────────────────────────────────────────────────
-        avail_text = raw_text.lower()
-        if "momentan indisponibil" in avail_text:
-            in_stock   = False
-            availability = "Out of stock"
-        elif "stoc bucuresti" in avail_text:
-            in_stock   = True
-            availability = "In stock (Bucharest)"
-        elif "in stoc furnizor" in avail_text:
-            in_stock   = True
-            availability = "In stock (supplier)"
-        elif "la comanda" in avail_text:
-            in_stock   = True
-            availability = "Order only"
-        else:
-            in_stock   = True
-            availability = "Unknown"
+        found = {m.lower() for m in AVAIL_RE.findall(raw_text)}
+        in_stock, availability = next(
+            (v for k, v in AVAILABILITY.items() if k in found),
+            (True, "Unknown"),
+        )
 
         # ── Discount ─────────────────────────────────────────────────────────
-        disc_match = re.search(r"Reducere\s+(\d+%)", raw_text)
+        disc_match = DISCOUNT_RE.search(raw_text)
         discount   = f"Reducere {disc_match.group(1)}" if disc_match else ""
 
         # ── Product code ─────────────────────────────────────────────────────
-        cod_match = re.search(r"Cod produs:\s*(\S+)", raw_text)
+        cod_match = COD_RE.search(raw_text)
         product_code = cod_match.group(1) if cod_match else ""
 
-        results.append({
-            "source":        SOURCE,
-            "name":          title,
-            "price":         fmt(sale_price_str),
-            "original_price":fmt(orig_price_str),
-            "price_value":   price_value,
-            "currency":      "RON (lei)",
-            "discount":      discount,
-            "availability":  availability,
-            "in_stock":      in_stock,
-            "product_code":  product_code,
-            "shop":          SOURCE,
-            "url":           href,
-            "scraped_at":    datetime.now().isoformat(),
-        })
+        results.append(Product(
+            source         = SOURCE,
+            name           = title,
+            price          = fmt(sale_price_str),
+            original_price = fmt(orig_price_str),
+            price_value    = price_value,
+            currency       = "RON (lei)",
+            discount       = discount,
+            availability   = availability,
+            in_stock       = in_stock,
+            product_code   = product_code,
+            shop           = SOURCE,
+            url            = href,
+            scraped_at     = scraped_at,
+        ))
 
     return results
 
 
+def parse_listing_page_bytes(
+    html: bytes,
+    seen_urls: set[str] | None = None,
+    scraped_at: str | None = None,
+) -> list[Product]:
+    """parse_listing_page() straight from raw HTML, for use in worker processes."""
+    return parse_listing_page(scan_page(html), seen_urls, scraped_at)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Pagination
 # ─────────────────────────────────────────────────────────────────────────────
 
-def get_all_page_urls(soup: BeautifulSoup, base_category_url: str) -> list[str]:
+def get_all_page_urls(page: ListingTarget, base_category_url: str) -> list[str]:
     """
     Extract ALL pagination URLs from a category page.
     The site shows links like: page-2, page-3 ... page-8, then page-9 ("2-16")
@@ -223,25 +531,17 @@ def get_all_page_urls(soup: BeautifulSoup, base_category_url: str) -> list[str]:
     """
     page_urls = [base_category_url]  # page 1
 
-    # Find all pagination links
+    # Find all pagination links in one pass over the page's links
     page_numbers = set()
-    for a in soup.select("a[href]"):
-        href = a.get("href", "")
-        m = re.search(r"/page-(\d+)/?$", href)
-        if m:
-            page_numbers.add(int(m.group(1)))
-
-    # Also look for "2 - 16" style grouped links
-    for a in soup.select("a[href]"):
-        href = a.get("href", "")
-        m = re.search(r"/page-(\d+)/?$", href)
-        if m:
-            # The text of this link might tell us the range, e.g. "2 - 16"
-            text = a.get_text(strip=True)
-            range_m = re.match(r"(\d+)\s*-\s*(\d+)", text)
-            if range_m:
-                for n in range(int(range_m.group(1)), int(range_m.group(2)) + 1):
-                    page_numbers.add(n)
+    for href, text in page.links:
+        m = PAGE_N_RE.search(href)
+        if not m:
+            continue
+        page_numbers.add(int(m.group(1)))
+        # The text of this link might tell us the range, e.g. "2 - 16"
+        range_m = RANGE_RE.match(text)
+        if range_m:
+            page_numbers.update(range(int(range_m.group(1)), int(range_m.group(2)) + 1))
 
     for n in sorted(page_numbers):
         # Build URL: strip trailing slash, append /page-N/
@@ -251,11 +551,9 @@ def get_all_page_urls(soup: BeautifulSoup, base_category_url: str) -> list[str]:
     return page_urls
 
 
-def get_next_page_url(soup: BeautifulSoup) -> str | None:
+def get_next_page_url(page: ListingTarget) -> str | None:
     """Fallback: find the 'Urmatorul' (Next) link for sequential pagination."""
-    for a in soup.select("a[href]"):
-        text = a.get_text(strip=True)
-        href = a.get("href", "")
+    for href, text in page.links:
         if "Urmatorul" in text or "urmatorul" in text.lower():
             return href if href.startswith("http") else urljoin(BASE_URL, href)
     return None
@@ -265,116 +563,234 @@ def get_next_page_url(soup: BeautifulSoup) -> str | None:
 # High-level scrape functions
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_category(slug: str, max_pages: int = 999) -> list[dict]:
-    """Scrape ALL pages of a category."""
-    start_url = f"{BASE_URL}/{slug}/"
-    all_results: list[dict] = []
-
-    print(f"\n📂 Scraping category: /{slug}/")
+async def scrape_listing_async(
+    client: httpx.AsyncClient | None,
+    sem: asyncio.Semaphore,
+    pool: ProcessPoolExecutor,
+    url: str,
+    page_label: str,
+    seen_urls: set[str],
+    scraped_at: str,
+    queue: asyncio.Queue,
+) -> int | None:
+    """
+    Fetch one listing page, parse it in a worker process and queue the new
+    products for the writer. Progress is printed as soon as the page is done
+    (pages finish out of order). Returns the number queued (None on error).
+    """
+    html = await fetch_async(client, sem, url)
+    if html is None:
+        return None
+    # Parsing is CPU-bound: run it on another core while downloads continue
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(
+        pool, parse_listing_page_bytes, html, None, scraped_at
+    )
+    # Workers can't share seen_urls, so skip repeats here on the event loop
+    results = [p for p in results if p.url not in seen_urls]
+    seen_urls.update(p.url for p in results)
+    await queue.put(results)
+    print(f"  Page {page_label}: {url}")
+    print(f"    → {len(results)} products")
+    return len(results)
+
+
+async def write_jsonl(queue: asyncio.Queue, out: BinaryIO) -> int:
+    """Single writer: append queued product batches to out until None arrives."""
+    written = 0
+    while (batch := await queue.get()) is not None:
+        out.writelines(map(jsonl_line, batch))
+        written += len(batch)
+    return written
+
+
+def scrape_category(
+    slug: str,
+    out: BinaryIO,
+    max_pages: int = 999,
+    cache: bool = False,
+) -> int:
+    """
+    Scrape ALL pages of a category, writing products to out as JSON Lines as
+    pages come in. Returns the number of products written.
+    cache=True fetches via the cached SESSION.
+    """
+    return asyncio.run(_scrape_category_async(slug, out, max_pages, cache))
 
-    # Fetch page 1 first to discover all page URLs
-    print(f"  Fetching page 1 to discover pagination...")
-    soup1 = fetch(start_url)
-    if soup1 is None:
-        print("  ✗ Failed to fetch first page.")
-        return []
-
-    page_urls = get_all_page_urls(soup1, start_url)
-    total_pages = min(len(page_urls), max_pages)
-    print(f"  Discovered {len(page_urls)} pages — will scrape {total_pages}")
-
-    # Parse page 1
-    p1_results = parse_listing_page(soup1)
-    print(f"  Page 1: {len(p1_results)} products")
-    all_results.extend(p1_results)
-
-    # Scrape remaining pages
-    for i, url in enumerate(page_urls[1:total_pages], start=2):
-        time.sleep(1.2)
-        print(f"  Page {i}/{total_pages}: {url}")
-        soup = fetch(url)
-        if soup is None:
-            continue
-        results = parse_listing_page(soup)
-        print(f"    → {len(results)} products")
-        all_results.extend(results)
 
-    return all_results
+async def _scrape_category_async(slug: str, out: BinaryIO, max_pages: int, cache: bool) -> int:
+    queue: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(write_jsonl(queue, out))
+    try:
+        await _scrape_category_pages(slug, max_pages, cache, queue)
+    finally:
+        await queue.put(None)
+    return await writer
+
+
+async def _scrape_category_pages(
+    slug: str,
+    max_pages: int,
+    cache: bool,
+    queue: asyncio.Queue,
+) -> None:
+    start_url = f"{BASE_URL}/{slug}/"
+    seen_urls: set[str] = set()
+    scraped_at = datetime.now().isoformat()
 
+    print(f"\n📂 Scraping category: /{slug}/")
 
-def scrape_search(query: str, max_pages: int = 50) -> list[dict]:
-    """Search and scrape all result pages."""
+    sem    = asyncio.Semaphore(CONCURRENCY)
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+
+    # HTTP/2 multiplexes all the page GETs over (usually) one connection.
+    # Cached runs skip it and go through SESSION (see fetch_async).
+    async with (
+        contextlib.nullcontext() if cache else
+        httpx.AsyncClient(
+            http2=True, headers=HEADERS, limits=limits, timeout=20,
+            follow_redirects=True,   # as requests did; httpx defaults to off
+        )
+    ) as client:
+        # Fetch page 1 first to discover all page URLs
+        print(f"  Fetching page 1 to discover pagination...")
+        html1 = await fetch_async(client, sem, start_url)
+        if html1 is None:
+            print("  ✗ Failed to fetch first page.")
+            return
+        page1 = scan_page(html1)
+
+        page_urls = get_all_page_urls(page1, start_url)
+        total_pages = min(len(page_urls), max_pages)
+        print(f"  Discovered {len(page_urls)} pages — will scrape {total_pages}")
+
+        # Parse page 1
+        p1_results = parse_listing_page(page1, seen_urls, scraped_at)
+        print(f"  Page 1: {len(p1_results)} products")
+        await queue.put(p1_results)
+
+        # Fetch remaining pages concurrently (bounded by the semaphore);
+        # each page is parsed as soon as it arrives
+        rest  = page_urls[1:total_pages]
+        if not rest:
+            return
+
+        # "spawn" rather than fork: --cache runs already have SESSION/SQLite
+        # worker threads, and forking a threaded process can deadlock
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            await asyncio.gather(*(
+                scrape_listing_async(
+                    client, sem, pool, u, f"{i}/{total_pages}", seen_urls, scraped_at, queue
+                )
+                for i, u in enumerate(rest, start=2)
+            ))
+
+
+def scrape_search(query: str, out: BinaryIO, max_pages: int = 50) -> int:
+    """Search and scrape all result pages, writing products to out as JSON Lines."""
     start_url = f"{BASE_URL}/index.php?dispatch=products.search&q={quote_plus(query)}"
-    all_results: list[dict] = []
+    written = 0
     url  = start_url
     page = 1
+    seen_urls: set[str] = set()
+    scraped_at = datetime.now().isoformat()
 
     print(f"\n🔍 Searching: '{query}'")
 
     while url and page <= max_pages:
         print(f"  Page {page}: {url}")
-        soup = fetch(url)
-        if soup is None:
+        html = fetch(url)
+        if html is None:
             break
 
-        results = parse_listing_page(soup)
+        page_scan = scan_page(html)
+        results = parse_listing_page(page_scan, seen_urls, scraped_at)
         print(f"    → {len(results)} products")
-        all_results.extend(results)
+        out.writelines(map(jsonl_line, results))
+        written += len(results)
 
         if not results:
             break
 
-        url = get_next_page_url(soup)
+        url = get_next_page_url(page_scan)
         page += 1
         if url:
             time.sleep(1.2)
 
-    return all_results
+    return written
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Output
 # ─────────────────────────────────────────────────────────────────────────────
 
-def deduplicate(results: list[dict]) -> list[dict]:
-    seen, out = set(), []
-    for r in results:
-        if r["url"] not in seen:
-            seen.add(r["url"])
-            out.append(r)
-    return out
+def deduplicate(results: Iterable[Product]) -> list[Product]:
+    # First occurrence of each URL wins, in original order
+    out: dict[str, Product] = {}
+    for p in results:
+        out.setdefault(p.url, p)
+    return list(out.values())
 
 
-def save_results(results: list[dict], base_name: str = "tyre_results") -> None:
+def save_results(
+    results: Iterable[Product],
+    base_name: str = "tyre_results",
+    pretty: bool = False,
+) -> None:
+    """
+    Write <base_name>.json.gz (compact, for the dashboard) or, with pretty=True,
+    an indented <base_name>.json for reading by hand; plus <base_name>.csv.
+    """
+    # The scrapers already skip repeated URLs; this is only a safety net
     results = deduplicate(results)
 
-    with open(f"{base_name}.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    print(f"\n✅ Saved {len(results)} unique products → {base_name}.json")
+    if pretty:
+        json_path = f"{base_name}.json"
+        if orjson is not None:
+            # orjson serialises dataclasses natively and writes UTF-8 bytes
+            with open(json_path, "wb") as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump([asdict(p) for p in results], f, indent=2, ensure_ascii=False)
+    else:
+        # Compact + gzipped for the dashboard, which decompresses it in the browser
+        json_path = f"{base_name}.json.gz"
+        if orjson is not None:
+            with gzip.open(json_path, "wb") as f:
+                f.write(orjson.dumps(results))
+        else:
+            with gzip.open(json_path, "wt", encoding="utf-8") as f:
+                json.dump([asdict(p) for p in results], f,
+                          ensure_ascii=False, separators=(",", ":"))
+    print(f"\n✅ Saved {len(results)} unique products → {json_path}")
 
     if results:
         with open(f"{base_name}.csv", "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(map(operator.attrgetter(*FIELDS), results))
         print(f"✅ Saved {len(results)} unique products → {base_name}.csv")
 
     # ── Summary ──────────────────────────────────────────────────────────────
-    priced    = [r for r in results if r.get("price_value")]
-    in_stock  = [r for r in priced  if r["in_stock"]]
-    no_price  = [r for r in results if not r.get("price_value")]
+    priced    = [r for r in results if r.price_value]
+    in_stock  = [r for r in priced  if r.in_stock]
+    no_price  = [r for r in results if not r.price_value]
 
     if in_stock:
-        top = sorted(in_stock, key=lambda x: x["price_value"])
+        top = heapq.nsmallest(30, in_stock, key=lambda x: x.price_value)
         print(f"\n📊 Cheapest in-stock tyres:")
         print(f"  {'Sale Price':>14}  {'Original':>14}  {'Disc':>10}  Name")
         print("  " + "─" * 80)
-        for r in top[:30]:
+        for r in top:
             print(
-                f"  {r['price']:>14}  "
-                f"{(r.get('original_price') or '—'):>14}  "
-                f"{(r.get('discount') or '—'):>10}  "
-                f"{r['name'][:50]}"
+                f"  {r.price:>14}  "
+                f"{(r.original_price or '—'):>14}  "
+                f"{(r.discount or '—'):>10}  "
+                f"{r.name[:50]}"
             )
 
     print(f"\n  ┌─────────────────────────────────")
@@ -401,6 +817,8 @@ Examples:
   python tyre_scraper.py --search "120/70 ZR17"        # by size
   python tyre_scraper.py --category lichidari-de-stoc  # clearance section
   python tyre_scraper.py --pages 3                     # limit to 3 pages
+  python tyre_scraper.py --cache                       # reuse pages < 1h old
+  python tyre_scraper.py --pretty                      # readable .json, not .gz
         """,
     )
     parser.add_argument("--search",   help="Search keyword (brand / model / size)")
@@ -410,22 +828,34 @@ Examples:
                         help="Max pages to scrape (default: all pages)")
     parser.add_argument("--out",      default="tyre_results",
                         help="Output filename base (default: tyre_results)")
+    parser.add_argument("--pretty",   action="store_true",
+                        help="Write indented .json instead of compact .json.gz")
+    parser.add_argument("--cache",    action=argparse.BooleanOptionalAction, default=False,
+                        help=f"Cache pages on disk in {CACHE_NAME}.sqlite for "
+                             f"{CACHE_EXPIRE // 60} min (default: off)")
     args = parser.parse_args()
 
+    if args.cache:
+        enable_cache()
+
     print("🏍️  anvelopemoto.eu — Full Tyre Catalogue Scraper")
     print("=" * 50)
 
-    results = (
-        scrape_search(args.search, max_pages=args.pages)
-        if args.search
-        else scrape_category(args.category, max_pages=args.pages)
-    )
-
-    if not results:
+    # Products are streamed to JSONL as they are parsed, then read back once
+    # to build the final JSON/CSV
+    jsonl_path = f"{args.out}.jsonl"
+    with open(jsonl_path, "wb") as out:
+        written = (
+            scrape_search(args.search, out, max_pages=args.pages)
+            if args.search
+            else scrape_category(args.category, out, max_pages=args.pages, cache=args.cache)
+        )
+
+    if not written:
         print("\n⚠️  No products found.")
         return
 
-    save_results(results, args.out)
+    save_results(read_jsonl(jsonl_path), args.out, pretty=args.pretty)
 
 
 if __name__ == "__main__":